@@ -14,6 +14,9 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    # 검증된 access token 캐시 (최대 개수, 최대 보관 시간)
+    access_token_cache_size: int = 10_000
+    access_token_cache_ttl_seconds: int = 30
     cookie_secure: bool = True
 
     users_file: Path = Path(__file__).resolve().parent / "data/users.json"
@@ -27,6 +30,12 @@ class Settings(BaseSettings):
     db_user: str
     db_password: str
     db_name: str
+    # likes 라우터용 aiomysql 풀 크기 (SQLAlchemy 엔진 풀과 별도)
+    db_pool_min: int = 2
+    db_pool_max: int = 10
+    # 커넥션 재사용 한도(초): MySQL wait_timeout(기본 8시간)보다 먼저 재연결해 끊긴 커넥션 사용 방지
+    # SQLAlchemy 엔진 풀과 likes용 aiomysql 풀이 함께 사용
+    db_pool_recycle: int = 1800
 
     db_url: str
     db_echo: bool = False
@@ -0,0 +1,24 @@
+-- 성능 개선용 스키마 변경 (MySQL 8)
+-- 테이블 DDL은 이 저장소 밖에서 관리되므로 이 파일로 직접 적용해야 함
+-- ⚠️ 점검 시간(maintenance window) 필요: 아래 refresh_token 변환은 이전 코드와 새 코드 어느 쪽과도 동시에 호환되지 않음
+--    1) 모든 API 인스턴스 중지 -> 2) 이 파일 실행 -> 3) 새 코드 배포 후 기동
+-- 인덱스 이름은 SQLAlchemy 기본값(ix_<table>_<column>) 기준. 실제 이름이 다르면 SHOW INDEX FROM <table>로 확인 후 수정
+
+-- posts: get_posts_mine의 author_id 필터 + created_at 정렬을 filesort 없이 처리
+-- 복합 인덱스의 선두 컬럼이 author_id FK를 커버하므로, 먼저 생성한 뒤 단일 인덱스 삭제
+CREATE INDEX ix_posts_author_id_created_at ON posts (author_id, created_at);
+DROP INDEX ix_posts_author_id ON posts;
+
+-- user_sessions: cleanup_expired_sessions의 last_used_at 범위 조건을 인덱스 range scan으로 처리
+CREATE INDEX ix_user_sessions_last_used_at ON user_sessions (last_used_at);
+
+-- user_sessions.refresh_token: SHA-256 hex 문자열(VARCHAR(255)) -> 원본 digest 바이트(BINARY(32))
+-- 새 코드(hash_token)는 32바이트 digest를 저장/조회, 이전 코드는 hex 문자열을 저장/조회
+-- - 변환 전에 새 코드가 돌면: 로그인 INSERT 실패(Incorrect string value) + 기존 세션 매칭 실패
+-- - 변환 후에 이전 코드가 돌면: hex INSERT 실패 + hex 조회가 매칭되지 않아 로그인/refresh 모두 실패
+-- 기존 세션은 hex를 UNHEX로 변환해 유지
+-- 64자리 hex가 아닌 비정상 값은 변환할 수 없으므로 삭제 (해당 세션 사용자는 별도 안내 없이 로그아웃됨)
+DELETE FROM user_sessions WHERE refresh_token NOT REGEXP '^[0-9a-fA-F]{64}$';
+ALTER TABLE user_sessions MODIFY refresh_token VARBINARY(64) NOT NULL;
+UPDATE user_sessions SET refresh_token = UNHEX(refresh_token);
+ALTER TABLE user_sessions MODIFY refresh_token BINARY(32) NOT NULL;
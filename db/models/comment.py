@@ -21,8 +21,8 @@ class Comment(Base):
     content: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
-    author: Mapped["User | None"] = relationship(back_populates="comments", lazy="noload")
-    post: Mapped["Post"] = relationship(back_populates="comments", lazy="noload")
+    author: Mapped["User | None"] = relationship(back_populates="comments", lazy="raise_on_sql")
+    post: Mapped["Post"] = relationship(back_populates="comments", lazy="raise_on_sql")
 
     @property
     def author_nickname(self) -> str | None:
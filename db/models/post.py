@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import String, ForeignKey, Integer, DateTime, func, Text
+from sqlalchemy import String, ForeignKey, Integer, DateTime, func, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
@@ -14,9 +14,13 @@ if TYPE_CHECKING:
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # get_posts_mine: author_id 필터 + created_at 정렬을 인덱스만으로 처리 (author_id 단일 인덱스 대체)
+        Index("ix_posts_author_id_created_at", "author_id", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(40), primary_key=True)
-    author_id: Mapped[str | None] = mapped_column(String(40), ForeignKey("users.id", ondelete="SET NULL"), index=True)
+    author_id: Mapped[str | None] = mapped_column(String(40), ForeignKey("users.id", ondelete="SET NULL"))
     title: Mapped[str] = mapped_column(String(55), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     view_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -26,5 +30,9 @@ class Post(Base):
     # onupdate 미사용: 조회수/좋아요수 증가 시에도 트리거되므로, 콘텐츠 수정 시에만 애플리케이션에서 수동 갱신
     updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
-    author: Mapped["User | None"] = relationship(back_populates="posts", lazy="noload")
-    comments: Mapped[list["Comment"]] = relationship(back_populates="post", lazy="noload")
+    author: Mapped["User | None"] = relationship(back_populates="posts", lazy="raise_on_sql")
+    comments: Mapped[list["Comment"]] = relationship(back_populates="post", lazy="raise_on_sql", passive_deletes=True)
+
+    @property
+    def author_nickname(self) -> str | None:
+        return self.author.nickname if self.author else None
@@ -22,5 +22,5 @@ class User(Base):
     profile_img: Mapped[str | None] = mapped_column(String(500))
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
-    posts: Mapped[list["Post"]] = relationship(back_populates="author", lazy="noload")
-    comments: Mapped[list["Comment"]] = relationship(back_populates="author", lazy="noload")
+    posts: Mapped[list["Post"]] = relationship(back_populates="author", lazy="raise_on_sql", passive_deletes=True)
+    comments: Mapped[list["Comment"]] = relationship(back_populates="author", lazy="raise_on_sql", passive_deletes=True)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import String, DateTime, func, ForeignKey
+from sqlalchemy import String, DateTime, func, ForeignKey, BINARY
 from sqlalchemy.orm import Mapped, mapped_column
 
 from db.base import Base
@@ -11,7 +11,9 @@ class UserSession(Base):
 
     id: Mapped[str] = mapped_column(String(40), primary_key=True)
     user_id: Mapped[str] = mapped_column(String(40), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    refresh_token: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    # SHA-256 digest 원본 바이트 (hex 문자열 대비 인덱스 크기 절반, collation 없이 바이트 비교)
+    refresh_token: Mapped[bytes] = mapped_column(BINARY(32), nullable=False, index=True)
     device_info: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
-    last_used_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
\ No newline at end of file
+    # 만료 세션 일괄 삭제(cleanup_expired_sessions)의 범위 조건용 인덱스
+    last_used_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), index=True)
\ No newline at end of file
@@ -1,13 +1,19 @@
+import asyncio
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from typing import AsyncGenerator
 
 from config import settings
 
+POOL_SIZE = 5
+
 engine = create_async_engine(
     settings.db_url,
     echo=settings.db_echo,
-    pool_size=5,
+    pool_size=POOL_SIZE,
     max_overflow=10,
+    pool_recycle=settings.db_pool_recycle,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -23,3 +29,12 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
         await session.commit()
+
+
+async def warm_up_pool() -> None:
+    """시작 시 풀을 미리 채워 첫 요청들의 커넥션 수립 지연 제거"""
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(POOL_SIZE)))
@@ -8,8 +8,9 @@ from fastapi.responses import JSONResponse
 
 from config import settings
 from routers import users, posts, comments, likes
-from db.session import engine
+from db.session import engine, warm_up_pool
 from routers.posts import view_count_scheduler
+from routers.users import session_cleanup_scheduler
 from utils.database import init_db_pool, close_db_pool
 from utils.redis import init_redis_pool, close_redis_pool
 
@@ -19,11 +20,18 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db_pool()
+    await warm_up_pool()
     await init_redis_pool()
     scheduler_task = asyncio.create_task(view_count_scheduler(600))
+    session_cleanup_task = asyncio.create_task(session_cleanup_scheduler(600))
 
     yield
 
+    session_cleanup_task.cancel()
+    try:
+        await session_cleanup_task
+    except asyncio.CancelledError:
+        pass
     scheduler_task.cancel()
     try:
         await scheduler_task
@@ -36,6 +44,8 @@ async def lifespan(app: FastAPI):
     await engine.dispose()
 
 
+# 응답이 큰 목록 API는 utils/response.json_response로 pydantic-core가 직접 JSON 직렬화 (jsonable_encoder 생략)
+# 나머지는 단건 응답이라 JSON 인코더 차이가 미미하므로 default_response_class는 지정하지 않음
 app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
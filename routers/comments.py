@@ -1,6 +1,6 @@
-import uuid
+import secrets
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, status, Response
 from sqlalchemy import select, func
 from sqlalchemy.orm import joinedload
 
@@ -10,14 +10,23 @@ from routers.users import CurrentUserId
 from schemas.commons import PostId, Page, CommentId, Pagination, DBSession
 from schemas.comment import (
     CommentCreateRequest,
-    CommentItemBase,
+    CommentListAdapter,
     CommentListItem,
+    MyCommentListAdapter,
     CommentUpdateRequest,
     CommentListResponse,
     MyCommentListResponse,
 )
+from utils.response import json_response
 
 COMMENT_PAGE_SIZE = 10
+COMMENT_ITEM_COLUMNS = (
+    Comment.id,
+    Comment.post_id,
+    Comment.author_id,
+    Comment.content,
+    Comment.created_at,
+)
 
 
 router = APIRouter(
@@ -52,7 +61,7 @@ def check_comment_author(comment: Comment, user_id: str) -> None:
 
 
 @router.get("/posts/{post_id}/comments", response_model=CommentListResponse)
-async def get_comments(post_id: PostId, db: DBSession, page: Page = 1) -> CommentListResponse:
+async def get_comments(post_id: PostId, db: DBSession, page: Page = 1) -> Response:
     """게시글의 댓글 목록 조회"""
     # 게시글 존재 확인 + comment_count 조회
     result = await db.execute(select(Post).where(Post.id == post_id))
@@ -76,12 +85,13 @@ async def get_comments(post_id: PostId, db: DBSession, page: Page = 1) -> Commen
         .limit(COMMENT_PAGE_SIZE)
         .offset(offset)
     )
-    comments = result.unique().scalars().all()
+    # author는 다대일 joinedload라 행 중복이 없으므로 unique() 불필요
+    comments = result.scalars().all()
 
-    return CommentListResponse(
-        data=[CommentListItem.model_validate(c) for c in comments],
-        pagination=Pagination(page=page, total=total_pages)
-    )
+    return json_response(CommentListResponse(
+        data=CommentListAdapter.validate_python(comments, from_attributes=True),
+        pagination=Pagination.model_construct(page=page, total=total_pages)
+    ))
 
 
 async def get_comment_with_author(db, comment_id: str) -> Comment:
@@ -100,7 +110,7 @@ async def create_comment(
         post_id: PostId, user_id: CurrentUserId, comment: CommentCreateRequest, db: DBSession) -> CommentListItem:
     """댓글 작성"""
     new_comment = Comment(
-        id=f"comment_{uuid.uuid4().hex}",
+        id=f"comment_{secrets.token_hex(16)}",
         post_id=post_id,
         author_id=user_id,
         content=comment.content,
@@ -147,7 +157,7 @@ async def delete_comment(
 
 
 @router.get("/comments/me", response_model=MyCommentListResponse)
-async def get_comments_mine(user_id: CurrentUserId, db: DBSession, page: Page = 1) -> MyCommentListResponse:
+async def get_comments_mine(user_id: CurrentUserId, db: DBSession, page: Page = 1) -> Response:
     """내가 작성한 댓글 목록"""
     offset = (page - 1) * COMMENT_PAGE_SIZE
 
@@ -159,15 +169,15 @@ async def get_comments_mine(user_id: CurrentUserId, db: DBSession, page: Page =
 
     # 내 댓글 목록 조회 (최신순)
     result = await db.execute(
-        select(Comment)
+        select(*COMMENT_ITEM_COLUMNS)
         .where(Comment.author_id == user_id)
         .order_by(Comment.created_at.desc())
         .limit(COMMENT_PAGE_SIZE)
         .offset(offset)
     )
-    comments = result.scalars().all()
+    comments = result.all()
 
-    return MyCommentListResponse(
-        data=[CommentItemBase.model_validate(c) for c in comments],
-        pagination=Pagination(page=page, total=total_pages)
-    )
+    return json_response(MyCommentListResponse(
+        data=MyCommentListAdapter.validate_python(comments, from_attributes=True),
+        pagination=Pagination.model_construct(page=page, total=total_pages)
+    ))
@@ -1,11 +1,12 @@
 from datetime import datetime, UTC
 
 from aiomysql import IntegrityError
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, status, Response
 
 from routers.users import CurrentUserId
 from schemas.commons import PostId, Page, Pagination, CurrentCursor
-from schemas.like import LikedListItem, ListPostILiked, LikeStatusResponse
+from schemas.like import LikedListAdapter, ListPostILiked, LikeStatusResponse
+from utils.response import json_response
 
 LIKES_PAGE_SIZE = 20
 
@@ -15,7 +16,7 @@ router = APIRouter(
 
 
 @router.get("/posts/liked", response_model=ListPostILiked)
-async def get_posts_liked(user_id: CurrentUserId, cur: CurrentCursor, page: Page = 1) -> ListPostILiked:
+async def get_posts_liked(user_id: CurrentUserId, cur: CurrentCursor, page: Page = 1) -> Response:
     """내가 좋아요한 게시글 목록"""
     offset = (page - 1) * LIKES_PAGE_SIZE
 
@@ -40,10 +41,10 @@ async def get_posts_liked(user_id: CurrentUserId, cur: CurrentCursor, page: Page
     )
     liked_posts = await cur.fetchall()
 
-    return ListPostILiked(
-        data=[LikedListItem(**post) for post in liked_posts],
-        pagination=Pagination(page=page, total=total_pages)
-    )
+    return json_response(ListPostILiked(
+        data=LikedListAdapter.validate_python(liked_posts),
+        pagination=Pagination.model_construct(page=page, total=total_pages)
+    ))
 
 
 @router.post("/posts/{post_id}/likes", response_model=LikeStatusResponse,
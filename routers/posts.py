@@ -1,25 +1,30 @@
 import asyncio
-import uuid
+import secrets
 import logging
 from datetime import datetime, UTC
+from typing import get_args
 
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, status, HTTPException, Response
 from sqlalchemy import select, func, or_, update
 from sqlalchemy.orm import joinedload
 from db.models.post import Post
+from db.models.user import User
 from db.session import AsyncSessionLocal
 from schemas.commons import Page, PostId, Pagination, DBSession, CurrentUserId
 from schemas.post import (
     ListPostsQuery,
+    SortColumn,
+    SortOrder,
     PostCreateRequest,
     PostCreateResponse,
-    PostListItem,
+    PostListAdapter,
     PostUpdateRequest,
     ListPostsResponse,
-    MyPostListItem,
+    MyPostListAdapter,
     MyPostsResponse,
     PostDetail)
 from utils.redis import get_redis
+from utils.response import json_response
 
 # TODO: liked_count -> Elasticsearch로 성능 개선 고려
 
@@ -29,10 +34,20 @@ SORT_COLUMN_MAP = {
     'view_count': Post.view_count,
     'like_count': Post.like_count
 }
+# 목록 응답(PostItemBase)에 필요한 컬럼만 조회 (ORM 객체 생성 생략)
+POST_ITEM_COLUMNS = (
+    Post.id,
+    Post.author_id,
+    Post.title,
+    Post.view_count,
+    Post.like_count,
+    Post.comment_count,
+    Post.created_at,
+)
 logger = logging.getLogger(__name__)
 
 
-def get_order_by(sort: str, order: str) -> list:
+def build_order_by(sort: str, order: str) -> tuple:
     """정렬 옵션 매핑"""
     column = SORT_COLUMN_MAP.get(sort)
     if column is None:
@@ -40,8 +55,16 @@ def get_order_by(sort: str, order: str) -> list:
 
     ordered = column.desc() if order == "desc" else column.asc()
     if sort != "created_at":
-        return [ordered, Post.created_at.desc()]
-    return [ordered]
+        return ordered, Post.created_at.desc()
+    return (ordered,)
+
+
+# (sort, order) 조합별 ORDER BY 절을 import 시점에 미리 생성 (요청마다 재생성 방지)
+ORDER_BY_MAP = {
+    (sort, order): build_order_by(sort, order)
+    for sort in get_args(SortColumn)
+    for order in get_args(SortOrder)
+}
 
 
 router = APIRouter(
@@ -73,7 +96,7 @@ def check_post_author(post: Post, author_id: str) -> None:
 
 
 @router.get("/posts", response_model=ListPostsResponse)
-async def get_posts(db: DBSession, query: ListPostsQuery = Depends()) -> ListPostsResponse:
+async def get_posts(db: DBSession, query: ListPostsQuery = Depends()) -> Response:
     """
     게시글 전체 목록 조회
     - 검색
@@ -98,20 +121,23 @@ async def get_posts(db: DBSession, query: ListPostsQuery = Depends()) -> ListPos
     total_count = (await db.execute(count_query)).scalar()
     total_pages = (total_count + PAGE_SIZE - 1) // PAGE_SIZE or 1
 
-    # 게시글 목록 조회
-    posts_query = select(Post).options(joinedload(Post.author))
+    # 게시글 목록 조회 (작성자 닉네임은 JOIN으로 함께 조회, 탈퇴한 작성자는 NULL)
+    posts_query = (
+        select(*POST_ITEM_COLUMNS, User.nickname.label("author_nickname"))
+        .outerjoin(User, Post.author_id == User.id)
+    )
     if where_condition is not None:
         posts_query = posts_query.where(where_condition)
-    posts_query = posts_query.order_by(*get_order_by(query.sort.value, query.order.value))
+    posts_query = posts_query.order_by(*ORDER_BY_MAP[(query.sort, query.order)])
     posts_query = posts_query.limit(PAGE_SIZE).offset(offset)
 
     result = await db.execute(posts_query)
-    posts = result.unique().scalars().all()
+    posts = result.all()
 
-    return ListPostsResponse(
-        data=[PostListItem.model_validate(post) for post in posts],
-        pagination=Pagination(page=query.page, total=total_pages)
-    )
+    return json_response(ListPostsResponse(
+        data=PostListAdapter.validate_python(posts, from_attributes=True),
+        pagination=Pagination.model_construct(page=query.page, total=total_pages)
+    ))
 
 
 @router.post("/posts", response_model=PostCreateResponse,
@@ -119,21 +145,21 @@ async def get_posts(db: DBSession, query: ListPostsQuery = Depends()) -> ListPos
 async def create_post(author_id: CurrentUserId, post: PostCreateRequest, db: DBSession) -> PostCreateResponse:
     """ 게시글 생성 """
     new_post = Post(
-        id=f"post_{uuid.uuid4().hex}",
+        id=f"post_{secrets.token_hex(16)}",
         author_id=author_id,
         title=post.title,
         content=post.content,
     )
 
+    # 응답에는 애플리케이션에서 생성한 id만 필요하므로 refresh(SELECT) 생략
     db.add(new_post)
     await db.flush()
-    await db.refresh(new_post)
 
     return PostCreateResponse.model_validate(new_post)
 
 
 @router.get("/posts/me", response_model=MyPostsResponse)
-async def get_posts_mine(user_id: CurrentUserId, db: DBSession, page: Page = 1) -> MyPostsResponse:
+async def get_posts_mine(user_id: CurrentUserId, db: DBSession, page: Page = 1) -> Response:
     """내가 작성한 게시글 목록"""
     offset = (page - 1) * PAGE_SIZE
 
@@ -145,18 +171,18 @@ async def get_posts_mine(user_id: CurrentUserId, db: DBSession, page: Page = 1)
 
     # 내 게시글 목록 조회
     result = await db.execute(
-        select(Post)
+        select(*POST_ITEM_COLUMNS)
         .where(Post.author_id == user_id)
         .order_by(Post.created_at.desc())
         .limit(PAGE_SIZE)
         .offset(offset)
     )
-    posts = result.scalars().all()
+    posts = result.all()
 
-    return MyPostsResponse(
-        data=[MyPostListItem.model_validate(post) for post in posts],
-        pagination=Pagination(page=page, total=total_pages)
-    )
+    return json_response(MyPostsResponse(
+        data=MyPostListAdapter.validate_python(posts, from_attributes=True),
+        pagination=Pagination.model_construct(page=page, total=total_pages)
+    ))
 
 
 async def flush_view_counts():
@@ -1,13 +1,16 @@
-import uuid
+import asyncio
+import logging
+import secrets
 from datetime import datetime, UTC, timedelta
 
 from fastapi import APIRouter, HTTPException, status, Response, Cookie, Request
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, literal, update
 
 from config import settings
 from db.models.user import User
 from db.models.user_session import UserSession
+from db.session import AsyncSessionLocal
 from schemas.commons import UserId, DBSession, CurrentUserId
 from schemas.user import (
     UserMyProfile,
@@ -16,10 +19,17 @@ from schemas.user import (
     TokenRefreshResponse,
 )
 from utils.auth import (
-    hash_password, verify_password, create_access_token, create_refresh_token,
-    decode_token, DUMMY_HASH, hash_token
+    hash_password_async, verify_password_async, password_needs_rehash, create_access_token, create_refresh_token,
+    decode_token, simulate_password_verify, hash_token
 )
 
+# refresh 시 last_used_at은 이 간격보다 오래됐을 때만 갱신
+SESSION_TOUCH_INTERVAL = timedelta(hours=1)
+# last_used_at이 최대 SESSION_TOUCH_INTERVAL만큼 늦게 기록되므로 그만큼 여유를 둔 만료 기준
+SESSION_EXPIRE_AFTER = timedelta(days=settings.refresh_token_expire_days) + SESSION_TOUCH_INTERVAL
+
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     tags=["USERS"],
 )
@@ -29,15 +39,24 @@ router = APIRouter(
              status_code=status.HTTP_201_CREATED)
 async def create_user(user: UserCreateRequest, db: DBSession) -> UserCreateResponse:
     """회원가입"""
+    # 이메일 중복 확인 (row 대신 상수 1만 조회)
+    email_exists = await db.scalar(select(literal(1)).where(User.email == user.email).limit(1))
+    if email_exists:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Email already registered",
+        )
+
     new_user = User(
-        id=f"user_{uuid.uuid4().hex}",
+        id=f"user_{secrets.token_hex(16)}",
         email=user.email,
         nickname=user.nickname,
-        password=hash_password(user.password),
+        password=await hash_password_async(user.password),
         profile_img=user.profile_img,
     )
     db.add(new_user)
 
+    # 동시 가입 경합은 UNIQUE 제약으로 최종 방어
     try:
         await db.flush()
     except IntegrityError:
@@ -50,6 +69,18 @@ async def create_user(user: UserCreateRequest, db: DBSession) -> UserCreateRespo
 
 
 REFRESH_TOKEN_COOKIE_KEY = "refresh_token"
+# 쿠키 속성은 설정값으로 고정되므로 import 시점에 한 번만 생성
+_REFRESH_TOKEN_COOKIE_ATTRS = (
+    f"; HttpOnly; Max-Age={settings.refresh_token_expire_days * 24 * 60 * 60}; Path=/; SameSite=lax"
+    + ("; Secure" if settings.cookie_secure else "")
+)
+
+
+def set_refresh_token_cookie(response: Response, refresh_token: str) -> None:
+    """Refresh token HttpOnly 쿠키 설정 (JWT는 쿠키 안전 문자만 사용하므로 인코딩 불필요)"""
+    response.headers.append(
+        "set-cookie", f"{REFRESH_TOKEN_COOKIE_KEY}={refresh_token}{_REFRESH_TOKEN_COOKIE_ATTRS}"
+    )
 
 
 @router.post("/auth/tokens", response_model=UserLoginResponse)
@@ -60,20 +91,28 @@ async def get_auth_tokens(
         db: DBSession,
 ) -> UserLoginResponse:
     """로그인"""
-    result = await db.execute(select(User).where(User.email == user.email))
-    db_user = result.scalar_one_or_none()
-
-    # 타이밍 공격 방지: 유저 존재 여부와 관계없이 항상 해시 비교 수행
-    hashed_password = db_user.password if db_user else DUMMY_HASH
-    is_password_correct = verify_password(user.password, hashed_password)
-
-    if db_user is None or not is_password_correct:
+    # 로그인에는 id, password만 필요
+    result = await db.execute(select(User.id, User.password).where(User.email == user.email))
+    db_user = result.one_or_none()
+
+    # 타이밍 공격 방지: 유저가 없어도 해시 검증과 같은 시간만큼 대기한 뒤 실패 처리
+    # (길이 범위를 벗어난 비밀번호는 UserLoginRequest 검증에서 해싱 전에 거절됨)
+    if db_user is None:
+        await simulate_password_verify()
+        is_password_correct = False
+    else:
+        is_password_correct = await verify_password_async(user.password, db_user.password)
+
+    if not is_password_correct:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
         )
 
-    # TODO: 오래된 세션 정리 -> 배치 작업 처리
+    # 레거시 bcrypt 해시 / 이전 Argon2 파라미터 해시는 로그인 성공 시 재해싱
+    if password_needs_rehash(db_user.password):
+        new_hash = await hash_password_async(user.password)
+        await db.execute(update(User).where(User.id == db_user.id).values(password=new_hash))
 
     # 토큰 생성
     token_data = {"sub": db_user.id}
@@ -82,7 +121,7 @@ async def get_auth_tokens(
 
     # 세션 생성
     new_session = UserSession(
-        id=f"session_{uuid.uuid4().hex}",
+        id=f"session_{secrets.token_hex(16)}",
         user_id=db_user.id,
         refresh_token=hash_token(refresh_token),
         device_info=request.headers.get("User-Agent", "Unknown"),
@@ -92,15 +131,7 @@ async def get_auth_tokens(
     await db.flush()
 
     # Refresh token을 HttpOnly 쿠키로 설정
-    response.set_cookie(
-        key=REFRESH_TOKEN_COOKIE_KEY,
-        value=refresh_token,
-        httponly=True,
-        secure=settings.cookie_secure,
-        samesite="lax",
-        max_age=settings.refresh_token_expire_days * 24 * 60 * 60,
-        path="/",
-    )
+    set_refresh_token_cookie(response, refresh_token)
 
     return UserLoginResponse(access_token=access_token)
 
@@ -155,23 +186,36 @@ async def refresh_access_token(
     # 새 refresh token으로 업데이트 + last_used_at 갱신
     session.refresh_token = hash_token(new_refresh_token)
     now = datetime.now(UTC)
-    if session.last_used_at is None or now - session.last_used_at > timedelta(hours=1):
+    if session.last_used_at is None or now - session.last_used_at > SESSION_TOUCH_INTERVAL:
         session.last_used_at = now
 
     # 새 refresh token을 쿠키에 설정 (원본)
-    response.set_cookie(
-        key=REFRESH_TOKEN_COOKIE_KEY,
-        value=new_refresh_token,
-        httponly=True,
-        secure=settings.cookie_secure,
-        samesite="lax",
-        max_age=settings.refresh_token_expire_days * 24 * 60 * 60,
-        path="/",
-    )
+    set_refresh_token_cookie(response, new_refresh_token)
 
     return TokenRefreshResponse(access_token=new_access_token)
 
 
+async def cleanup_expired_sessions() -> int:
+    """refresh token 만료 기간이 지난 세션 일괄 삭제"""
+    cutoff = datetime.now(UTC) - SESSION_EXPIRE_AFTER
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            delete(UserSession).where(UserSession.last_used_at < cutoff)
+        )
+        await db.commit()
+    return result.rowcount
+
+
+async def session_cleanup_scheduler(interval_seconds: int = 600):
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            deleted = await cleanup_expired_sessions()
+            logger.info(f"[Scheduler] Expired sessions cleaned: {deleted}")
+        except Exception as e:
+            logger.error(f"[Scheduler] Session cleanup failed: {e}", exc_info=True)
+
+
 @router.post("/auth/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout(
         response: Response,
@@ -190,8 +234,7 @@ async def logout(
 @router.get("/users/me", response_model=UserMyProfile)
 async def get_my_profile(user_id: CurrentUserId, db: DBSession) -> UserMyProfile:
     """내 프로필 조회"""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id)
 
     if user is None:
         raise HTTPException(
@@ -206,8 +249,7 @@ async def get_my_profile(user_id: CurrentUserId, db: DBSession) -> UserMyProfile
 async def update_my_profile(user_id: CurrentUserId, update_data: UserUpdateRequest,
                             db: DBSession) -> UserMyProfile:
     """내 프로필 수정"""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -218,8 +260,8 @@ async def update_my_profile(user_id: CurrentUserId, update_data: UserUpdateReque
     for field, value in update_fields.items():
         setattr(user, field, value)
 
+    # 변경값은 이미 객체에 반영되어 있고 server onupdate 컬럼도 없으므로 refresh(SELECT) 생략
     await db.flush()
-    await db.refresh(user)
 
     return UserMyProfile.model_validate(user)
 
@@ -227,10 +269,7 @@ async def update_my_profile(user_id: CurrentUserId, update_data: UserUpdateReque
 @router.get("/users/{user_id}", response_model=UserProfile)
 async def get_specific_user(user_id: UserId, db: DBSession) -> UserProfile:
     """특정 유저 프로필 조회"""
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from schemas.commons import Content, CommentId, Pagination, PostId, UserId
 
@@ -29,6 +29,9 @@ class CommentListItem(CommentItemBase):
 
 MyCommentListItem = CommentItemBase
 
+CommentListAdapter = TypeAdapter(list[CommentListItem])
+MyCommentListAdapter = TypeAdapter(list[MyCommentListItem])
+
 
 class CommentUpdateRequest(BaseModel):
     model_config = ConfigDict(extra='forbid')
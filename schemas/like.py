@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from schemas.commons import PostId, UserId, Pagination, Count, Title
 
@@ -14,6 +14,9 @@ class LikedListItem(BaseModel):
     created_at: datetime
 
 
+LikedListAdapter = TypeAdapter(list[LikedListItem])
+
+
 class ListPostILiked(BaseModel):
     data: list[LikedListItem]
     pagination: Pagination
@@ -1,21 +1,13 @@
 from datetime import datetime
-from enum import Enum
-from typing import Annotated, Any
+from typing import Annotated, Literal
 
-from pydantic import StringConstraints, BaseModel, Field, model_validator, ConfigDict, computed_field
+from pydantic import StringConstraints, BaseModel, Field, model_validator, ConfigDict, TypeAdapter
 
 from schemas.commons import PostId, UserId, Pagination, Page, Content, Title, Count
 
 
-class SortColumn(str, Enum):
-    CREATED_AT = "created_at"
-    VIEW_COUNT = "view_count"
-    LIKE_COUNT = "like_count"
-
-
-class SortOrder(str, Enum):
-    ASC = "asc"
-    DESC = "desc"
+SortColumn = Literal["created_at", "view_count", "like_count"]
+SortOrder = Literal["asc", "desc"]
 
 
 class PostItemBase(BaseModel):
@@ -33,16 +25,15 @@ class PostItemBase(BaseModel):
 
 class PostListItem(PostItemBase):
     """게시글 목록 아이템 (author_nickname 포함)"""
-    author: Any = Field(exclude=True)
-
-    @computed_field
-    @property
-    def author_nickname(self) -> str:
-        return getattr(self.author, "nickname", "Unknown")
+    author_nickname: str | None
 
 
 MyPostListItem = PostItemBase
 
+# 페이지 단위 일괄 검증용 (행마다 model_validate 호출하는 오버헤드 제거)
+PostListAdapter = TypeAdapter(list[PostListItem])
+MyPostListAdapter = TypeAdapter(list[MyPostListItem])
+
 
 class PostDetail(PostListItem):
     content: Content
@@ -57,8 +48,8 @@ class ListPostsQuery(BaseModel):
         StringConstraints(strip_whitespace=True, min_length=1, max_length=20),
         Field(description="게시글 제목 또는 내용에 포함된 검색어")
     ] = None
-    sort: SortColumn = SortColumn.CREATED_AT
-    order: SortOrder = SortOrder.DESC
+    sort: SortColumn = "created_at"
+    order: SortOrder = "desc"
     page: Page = 1
 
 
@@ -91,8 +82,10 @@ class PostUpdateRequest(BaseModel):
     title: Title | None = None
     content: Content | None = None
 
-    @model_validator(mode='after')
-    def at_least_one_field(self):
-        if self.title is None and self.content is None:
+    @model_validator(mode='before')
+    @classmethod
+    def at_least_one_field(cls, data):
+        """필드 검증 전에 원본 입력만으로 빈 요청을 거절"""
+        if isinstance(data, dict) and data.get("title") is None and data.get("content") is None:
             raise ValueError("수정할 필드가 없습니다.")
-        return self
+        return data
@@ -11,6 +11,8 @@ _RE_UPPER = re.compile(r"[A-Z]")
 _RE_LOWER = re.compile(r"[a-z]")
 _RE_DIGIT = re.compile(r"\d")
 _RE_SPECIAL = re.compile(rf"[{SPECIAL_CHARS}]")
+# 길이는 StringConstraints에서 검사하므로 허용 문자만 확인
+_RE_NICKNAME = re.compile(r"[A-Za-z0-9가-힣]+")
 
 
 def validate_password(password: str) -> str:
@@ -25,6 +27,19 @@ def validate_password(password: str) -> str:
     return password
 
 
+def validate_nickname(nickname: str) -> str:
+    if not _RE_NICKNAME.fullmatch(nickname):
+        raise ValueError("닉네임은 영문, 숫자, 한글만 사용할 수 있습니다")
+    return nickname
+
+
+def normalize_email(email: str) -> str:
+    """대소문자만 다른 이메일이 별개 계정으로 취급되지 않도록 소문자로 정규화"""
+    return email.lower()
+
+
+Email = Annotated[EmailStr, AfterValidator(normalize_email)]
+
 Password = Annotated[
     str,
     StringConstraints(
@@ -34,21 +49,30 @@ Password = Annotated[
     AfterValidator(validate_password),
 ]
 
+# 로그인용: 정책 검증 없이 길이만 제한 (빈 값/과도한 입력은 해싱 전에 422로 거절)
+LoginPassword = Annotated[
+    str,
+    StringConstraints(
+        min_length=1,
+        max_length=128,
+    ),
+]
+
 Nickname = Annotated[
     str,
     StringConstraints(
         strip_whitespace=True,
         min_length=1,
         max_length=10,
-        pattern=r"^[A-Za-z0-9가-힣]{1,10}$",
     ),
+    AfterValidator(validate_nickname),
 ]
 
 
 class UserCreateRequest(BaseModel):
     model_config = ConfigDict(extra='forbid')
 
-    email: EmailStr
+    email: Email
     password: Password
     nickname: Nickname
     profile_img: str | None = None
@@ -66,8 +90,8 @@ class UserCreateResponse(BaseModel):
 class UserLoginRequest(BaseModel):
     model_config = ConfigDict(extra='forbid')
 
-    email: EmailStr
-    password: str
+    email: Email
+    password: LoginPassword
 
 
 class TokenResponse(BaseModel):
@@ -95,18 +119,22 @@ class UserUpdateRequest(BaseModel):
     nickname: Nickname | None = None
     profile_img: str | None = None
 
-    @model_validator(mode='after')
-    def check_at_least_one_field(self):
+    @model_validator(mode='before')
+    @classmethod
+    def check_at_least_one_field(cls, data):
         """
         PATCH 요청에서 "미전송" vs "명시적 null 전송(삭제요청)"을 구분하기 위해
-        사용자가 실제로 보낸 필드 집합(model_fields_set)을 기준으로 검사
+        사용자가 실제로 보낸 키를 기준으로 검사 (필드 검증 전에 원본 입력으로 판단)
         """
-        if not self.model_fields_set:
+        if not isinstance(data, dict):
+            return data
+
+        if not data:
             raise ValueError("최소 하나의 필드는 입력 해야 합니다")
 
-        if "nickname" in self.model_fields_set and self.nickname is None:
+        if "nickname" in data and data["nickname"] is None:
             raise ValueError("nickname은 null로 설정할 수 없습니다.")
-        return self
+        return data
 
 
 class UserProfile(BaseModel):
@@ -10,7 +10,8 @@
 import sys
 from datetime import datetime, UTC
 from pathlib import Path
-import json
+
+import orjson
 
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -45,12 +46,16 @@ TEST_USERS = [
 def seed_users():
     """유저 데이터 생성"""
     users = []
+    # 테스트 계정끼리 같은 평문 비밀번호를 쓰므로 평문별로 한 번만 해싱
+    hashed_passwords = {}
     for user in TEST_USERS:
+        if user["password"] not in hashed_passwords:
+            hashed_passwords[user["password"]] = hash_password(user["password"])
         users.append({
             "id": user["id"],
             "email": user["email"],
             "nickname": user["nickname"],
-            "password": hash_password(user["password"]),
+            "password": hashed_passwords[user["password"]],
             "profile_img": user["profile_img"],
             "created_at": datetime.now(UTC).isoformat(),
         })
@@ -63,13 +68,11 @@ def seed():
 
     # Users
     users = seed_users()
-    with open(USERS_FILE, "w", encoding="utf-8") as f:
-        json.dump(users, f, indent=2, ensure_ascii=False)
+    USERS_FILE.write_bytes(orjson.dumps(users, option=orjson.OPT_INDENT_2))
 
     # 빈 데이터 파일들
     for file in [POSTS_FILE, COMMENTS_FILE, LIKES_FILE]:
-        with open(file, "w", encoding="utf-8") as f:
-            json.dump([], f)
+        file.write_bytes(orjson.dumps([]))
 
     print("✅ 테스트 데이터 생성 완료!")
     print(f"\n📁 저장 위치: {DATA_DIR}")
@@ -1,10 +1,23 @@
+import asyncio
+import base64
+import binascii
 import hashlib
 import hmac
 import logging
+import random
+import statistics
+import threading
+import time
+from collections import deque
 from datetime import datetime, UTC, timedelta
+from typing import Final
 
 import bcrypt
 import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from argon2.low_level import ARGON2_VERSION
+from cachetools import TLRUCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
@@ -15,60 +28,148 @@ logger = logging.getLogger(__name__)
 # Bearer 토큰 인증 스키마
 security = HTTPBearer()
 
+# JWT 서명/검증 키와 허용 알고리즘 (요청마다 str -> bytes 변환, 리스트 생성 방지)
+_JWT_SIGNING_KEY = settings.secret_key.encode()
+_JWT_ALGORITHMS: tuple[str, ...] = (settings.algorithm,)
+# 발급하는 토큰에는 exp/sub만 있고 aud/iss/nbf는 사용하지 않음 (aud/iss를 도입하면 해당 검증을 다시 켤 것)
+_JWT_DECODE_OPTIONS = {
+    "require": ["exp", "sub"],
+    "verify_aud": False,
+    "verify_iss": False,
+    "verify_nbf": False,
+}
+# 비밀번호 사전 해싱용 PEPPER (호출마다 str -> bytes 변환 방지)
+_PEPPER_BYTES = settings.password_pepper.encode()
+# PEPPER 키가 적용된 HMAC 초기 상태 (호출마다 copy()로 복제해 키 패딩/초기화 생략, 원본은 변경하지 않음)
+_PREHASH_HMAC = hmac.new(key=_PEPPER_BYTES, digestmod="sha256")
+
 
 def _prehash(password: str) -> bytes:
     """
     HMAC-SHA256으로 사전 해싱
-    - bcrypt 72바이트 제한 우회
+    - bcrypt 72바이트 제한 우회 (레거시 bcrypt 해시 검증용)
     - PEPPER로 password shucking 공격 방지
+    - hexlify로 digest를 바로 hex bytes로 변환 (기존 hexdigest().encode()와 동일한 값)
     """
-    return hmac.new(
-        key=settings.password_pepper.encode(),
-        msg=password.encode(),
-        digestmod="sha256"
-    ).hexdigest().encode()
+    mac = _PREHASH_HMAC.copy()
+    mac.update(password.encode())
+    return binascii.hexlify(mac.digest())
+
+
+# Argon2id 해셔 (OWASP 권장: m=46MiB, t=1), 2개 lane을 병렬 스레드로 계산해 지연 시간 단축
+# 해시 문자열에 파라미터가 기록되므로 변경 시 check_needs_rehash로 점진 마이그레이션
+_password_hasher = PasswordHasher(time_cost=1, memory_cost=47104, parallelism=2, hash_len=32)
+
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
 
 
 def hash_password(password: str) -> str:
     prehashed = _prehash(password)
-    return bcrypt.hashpw(prehashed, bcrypt.gensalt()).decode()
+    return _password_hasher.hash(prehashed)
+
+
+def _build_dummy_hash() -> str:
+    """
+    _password_hasher와 같은 파라미터의 Argon2 해시 문자열 조립 (import 시점 해싱 방지)
+    - 검증 비용은 타입/m/t/p로 결정되므로 salt/digest는 길이만 맞춘 고정 값으로 충분
+    - 해셔 파라미터를 바꾸면 더미 해시도 자동으로 따라감
+    """
+    salt = base64.b64encode(bytes(_password_hasher.salt_len)).decode().rstrip("=")
+    digest = base64.b64encode(bytes(_password_hasher.hash_len)).decode().rstrip("=")
+    return (
+        f"$argon2{_password_hasher.type.name.lower()}$v={ARGON2_VERSION}"
+        f"$m={_password_hasher.memory_cost},t={_password_hasher.time_cost},p={_password_hasher.parallelism}"
+        f"${salt}${digest}"
+    )
 
 
 # 타이밍 공격 방지용 더미 해시
-DUMMY_HASH = hash_password("dummy_password_for_timing_attack_prevention")
+DUMMY_HASH: Final[str] = _build_dummy_hash()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     prehashed = _prehash(plain_password)
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        try:
+            return bcrypt.checkpw(prehashed, hashed_password.encode())
+        except ValueError:
+            logger.warning("Invalid hash format detected")
+            return False
+
     try:
-        return bcrypt.checkpw(prehashed, hashed_password.encode())
-    except ValueError:
+        return _password_hasher.verify(hashed_password, prehashed)
+    except VerificationError:
+        return False
+    except InvalidHashError:
         logger.warning("Invalid hash format detected")
         return False
 
 
-def hash_token(token: str) -> str:
-    return hashlib.sha256(token.encode()).hexdigest()
+async def hash_password_async(password: str) -> str:
+    """hash_password를 스레드에서 실행 (이벤트 루프 블로킹 방지)"""
+    return await asyncio.to_thread(hash_password, password)
+
+
+# 최근 실제 검증 소요 시간 (스레드 대기 포함), 존재하지 않는 이메일 로그인 시 대기 시간 산정용
+# 고정 샘플 대신 계속 갱신되는 윈도우를 사용해 부하 변화에 따라 두 실패 경로의 응답 시간이 벌어지지 않도록 함
+VERIFY_DURATION_WINDOW = 50
+_verify_durations: deque[float] = deque(maxlen=VERIFY_DURATION_WINDOW)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password를 스레드에서 실행 (이벤트 루프 블로킹 방지) + 소요 시간 기록"""
+    started = time.perf_counter()
+    is_valid = await asyncio.to_thread(verify_password, plain_password, hashed_password)
+    _verify_durations.append(time.perf_counter() - started)
+    return is_valid
+
+
+async def simulate_password_verify() -> None:
+    """
+    검증 없이 검증 시간만큼 대기 (타이밍 공격 방지)
+    - 없는 계정으로의 로그인 폭주가 CPU를 소모하지 않도록 해시 연산 생략
+    - 대기 시간은 최근 실제 검증 시간의 중앙값 (아직 기록이 없으면 더미 해시를 실제로 검증)
+    - 지터를 더해 측정값 그대로의 고정 응답 시간이 드러나지 않도록 함
+    """
+    if not _verify_durations:
+        await verify_password_async("dummy_password", DUMMY_HASH)
+        return
+
+    verify_seconds = statistics.median(_verify_durations)
+    await asyncio.sleep(verify_seconds + random.uniform(-0.002, 0.002))
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """레거시 bcrypt 해시이거나 Argon2 파라미터가 현재 설정과 다르면 True"""
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
+    return _password_hasher.check_needs_rehash(hashed_password)
+
+
+def hash_token(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
     expire = datetime.now(UTC) + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
     to_encode.update({"exp": expire, "type": "access"})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    return jwt.encode(to_encode, _JWT_SIGNING_KEY, algorithm=settings.algorithm)
 
 
 def create_refresh_token(data: dict, expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
     expire = datetime.now(UTC) + (expires_delta or timedelta(days=settings.refresh_token_expire_days))
     to_encode.update({"exp": expire, "type": "refresh"})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    return jwt.encode(to_encode, _JWT_SIGNING_KEY, algorithm=settings.algorithm)
 
 
 def decode_token(token: str, expected_type: str) -> dict:
     """토큰 디코딩 및 타입 검증"""
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt.decode(
+            token, _JWT_SIGNING_KEY, algorithms=_JWT_ALGORITHMS, options=_JWT_DECODE_OPTIONS
+        )
         if payload.get("type") != expected_type:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -87,12 +188,41 @@ def decode_token(token: str, expected_type: str) -> dict:
         )
 
 
+def _access_token_ttu(_key: bytes, payload: dict, now: float) -> float:
+    """캐시 만료 시각: 설정된 TTL과 토큰 exp 중 빠른 쪽 (만료된 토큰이 캐시로 통과하지 않도록)"""
+    return min(now + settings.access_token_cache_ttl_seconds, payload.get("exp", now))
+
+
+# 검증 통과한 access token payload 캐시 (키는 원본 토큰 대신 SHA-256 해시)
+# exp가 epoch 초이므로 timer도 벽시계(time.time) 기준
+_access_token_cache = TLRUCache(
+    maxsize=settings.access_token_cache_size, ttu=_access_token_ttu, timer=time.time
+)
+# get_current_user_id는 sync 의존성이라 스레드풀에서 동시에 실행됨
+_access_token_cache_lock = threading.Lock()
+
+
+def decode_access_token(token: str) -> dict:
+    """access token 디코딩 (반복 요청은 캐시에서 반환해 서명 검증/JSON 파싱 생략)"""
+    key = hash_token(token)
+    with _access_token_cache_lock:
+        payload = _access_token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    # 만료/위조 토큰은 decode_token에서 예외가 발생하므로 캐시되지 않음
+    payload = decode_token(token, "access")
+    with _access_token_cache_lock:
+        _access_token_cache[key] = payload
+    return payload
+
+
 def get_current_user_id(
         credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> str:
     """현재 로그인한 유저 ID 반환"""
     token = credentials.credentials
-    payload = decode_token(token, "access")
+    payload = decode_access_token(token)
     user_id = payload.get("sub")
     if not user_id:
         raise HTTPException(
@@ -2,7 +2,7 @@
 
 import aiomysql
 
-import json
+import orjson
 
 from pathlib import Path
 from typing import Any, AsyncGenerator
@@ -21,15 +21,15 @@ def get_db_pool() -> aiomysql.Pool:
 
 
 async def get_cursor() -> AsyncGenerator[Cursor, None]:
+    """
+    autocommit 커넥션의 커서 반환
+    - 문장 단위로 커밋되므로 조회만 하는 요청에서 COMMIT 왕복이 발생하지 않음
+    - 여러 쓰기를 원자적으로 묶어야 하면 cur.connection.begin() / commit()으로 명시적 트랜잭션 사용
+    """
     pool = get_db_pool()
     async with pool.acquire() as conn:
         async with conn.cursor() as cur:
-            try:
-                yield cur
-                await conn.commit()
-            except Exception:
-                await conn.rollback()
-                raise
+            yield cur
 
 
 async def init_db_pool() -> None:
@@ -41,10 +41,11 @@ async def init_db_pool() -> None:
         password=settings.db_password,
         db=settings.db_name,
         charset='utf8mb4',
-        autocommit=False,
+        autocommit=True,
         cursorclass=aiomysql.DictCursor,
-        minsize=2,
-        maxsize=10,
+        minsize=settings.db_pool_min,
+        maxsize=settings.db_pool_max,
+        pool_recycle=settings.db_pool_recycle,
     )
 
 
@@ -61,10 +62,9 @@ def read_json(path: Path) -> Any:
         if not path.exists():
             return []
 
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(path.read_bytes())
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while processing data.",
@@ -0,0 +1,11 @@
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def json_response(model: BaseModel) -> Response:
+    """
+    이미 검증된 응답 모델을 pydantic-core로 바로 JSON 직렬화
+    - FastAPI response_model 재검증 + dict 변환 + JSON 인코딩 단계 생략
+    - response_model은 OpenAPI 문서용으로만 유지
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")